@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
 import re
 import shutil
+import signal
 import sys
 import tempfile
 import threading
 import time
 from pathlib import Path
-from typing import Callable
 
 from deadline.client.api import get_deadline_cloud_library_telemetry_client, TelemetryClient
 from openjd.adaptor_runtime._version import version as openjd_adaptor_version
@@ -25,9 +26,18 @@ from openjd.adaptor_runtime.application_ipc import ActionsQueue, AdaptorServer
 from openjd.adaptor_runtime._utils import secure_open
 
 from .._version import version as adaptor_version
+from .batching_handler import BatchingRegexHandler
+
+import openjd.adaptor_runtime_client
+import deadline.arnold_adaptor
 
 _logger = logging.getLogger(__name__)
 
+# Namespace directories added to the client's PYTHONPATH so that adaptor_runtime_client
+# is importable by the ArnoldClient process. Computed once at import time.
+_OPENJD_NAMESPACE_DIR = os.path.dirname(os.path.dirname(openjd.adaptor_runtime_client.__file__))
+_DEADLINE_NAMESPACE_DIR = os.path.dirname(os.path.dirname(deadline.arnold_adaptor.__file__))
+
 
 class ArnoldNotRunningError(Exception):
     """Error that is raised when attempting to use Arnold while it is not running"""
@@ -35,24 +45,73 @@ class ArnoldNotRunningError(Exception):
     pass
 
 
-_ARNOLD_INIT_KEYS = {
-    "scene_file",
-    "output_file_path",
-    "error_on_arnold_license_fail",
-}
-
-
-def _check_for_exception(func: Callable) -> Callable:
+class WaitEventSet:
     """
-    Decorator that checks if an exception has been caught before calling the
-    decorated function
+    A named set of event flags sharing one Condition, so a waiter can block until any
+    flag it is interested in is raised. Sources signal state transitions; waiters wake
+    only on those transitions instead of re-checking every source on a timer.
     """
 
-    def wrapped_func(self, *args, **kwargs):
-        if not self._has_exception:  # Raises if there is an exception
-            return func(self, *args, **kwargs)
+    def __init__(self, *names: str) -> None:
+        self._condition = threading.Condition()
+        self._flags = {name: False for name in names}
 
-    return wrapped_func
+    def set(self, name: str) -> None:
+        """
+        Raises the named flag and wakes all waiters.
+
+        :param name: The name of the flag to raise.
+        :type name: str
+        """
+        with self._condition:
+            self._flags[name] = True
+            self._condition.notify_all()
+
+    def clear(self, name: str) -> None:
+        """
+        Lowers the named flag.
+
+        :param name: The name of the flag to lower.
+        :type name: str
+        """
+        with self._condition:
+            self._flags[name] = False
+
+    def is_set(self, name: str) -> bool:
+        """
+        :param name: The name of the flag to check.
+        :type name: str
+
+        :returns: True if the named flag is currently raised.
+        :return type: bool
+        """
+        return self._flags[name]
+
+    def wait_any(self, names: tuple[str, ...], timeout: float | None = None) -> bool:
+        """
+        Blocks until any of the named flags is raised or the timeout elapses.
+
+        :param names: The names of the flags to wait on.
+        :type names: tuple[str, ...]
+        :param timeout: Maximum seconds to wait, or None to wait indefinitely.
+        :type timeout: float | None
+
+        :returns: True if one of the flags is raised, False on timeout.
+        :return type: bool
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: any(self._flags[name] for name in names), timeout=timeout
+            )
+
+
+_ARNOLD_INIT_KEYS = frozenset(
+    {
+        "scene_file",
+        "output_file_path",
+        "error_on_arnold_license_fail",
+    }
+)
 
 
 class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
@@ -68,24 +127,49 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
     _server: AdaptorServer | None = None
     _server_thread: threading.Thread | None = None
     _arnold_client: LoggingSubprocess | None = None
+    _stdout_handler: BatchingRegexHandler | None = None
     _action_queue = ActionsQueue()
     _is_rendering: bool = False
 
-    # If a thread raises an exception we will update this to raise in the main thread
+    # Flags signalled from the server-startup path, the stdout regex callbacks, and the
+    # client process so that the wait loops below wake on state transitions instead of
+    # polling each source on a timer.
+    _events = WaitEventSet("socket_ready", "render_done", "error", "client_exited")
+
+    # If a thread raises an exception we will update this to raise in the main thread.
+    # _exc_info_set is a plain int flag so the hot wait loops check it with a single
+    # cheap truthiness test instead of an object comparison.
     _exc_info: Exception | None = None
+    _exc_info_set: int = 0
     _performing_cleanup = False
 
+    # True once a SIGCHLD handler is installed to signal the client-exited flag; wait
+    # loops fall back to timed polling of is_running when it could not be installed.
+    _sigchld_installed: bool = False
+
     @property
     def integration_data_interface_version(self) -> SemanticVersion:
         return SemanticVersion(major=0, minor=1)
 
+    @functools.cached_property
+    def _validators(self) -> AdaptorDataValidators:
+        """
+        Loads the init_data and run_data validators from the adaptor schema directory.
+        The schemas are read and parsed once per process; the validators are cached.
+
+        :returns: The data validators for this adaptor.
+        :return type: AdaptorDataValidators
+        """
+        schema_dir = os.path.join(os.path.dirname(__file__), "schemas")
+        return AdaptorDataValidators.for_adaptor(schema_dir)
+
     @staticmethod
-    def _get_timer(timeout: int | float) -> Callable[[], bool]:
+    def _get_deadline(timeout: int | float) -> float:
         """
-        Given a timeout length, returns a lambda which returns True until the timeout occurs
+        Given a timeout length, returns a monotonic-clock deadline to compare against
+        time.monotonic(). Monotonic time is immune to wall-clock jumps and cheaper to read.
         """
-        timeout_time = time.time() + timeout
-        return lambda: time.time() < timeout_time
+        return time.monotonic() + timeout
 
     @property
     def _has_exception(self) -> bool:
@@ -97,7 +181,7 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
         :returns: False there is no exception waiting to be raised
         :return type: bool
         """
-        if self._exc_info and not self._performing_cleanup:
+        if self._exc_info_set and not self._performing_cleanup:
             raise self._exc_info
         return False
 
@@ -133,17 +217,14 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
 
     def _wait_for_socket(self) -> str:
         """
-        Performs a busy wait for the socket path that the adaptor server is running on, then returns it.
+        Waits for the socket path that the adaptor server is running on, then returns it.
 
         :raises: RuntimeError: If the server does not finish initializing
 
         :returns: The socket path the adaptor server is running on.
         :return type: str
         """
-        is_not_timed_out = self._get_timer(self._SERVER_START_TIMEOUT_SECONDS)
-        while (self._server is None or self._server.server_path is None) and is_not_timed_out():
-            time.sleep(0.01)
-
+        self._events.wait_any(("socket_ready",), timeout=self._SERVER_START_TIMEOUT_SECONDS)
         if self._server is not None and self._server.server_path is not None:
             return self._server.server_path
 
@@ -157,6 +238,7 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
         blocking call.
         """
         self._server = AdaptorServer(self._action_queue, self)
+        self._events.set("socket_ready")
         _logger.debug("start arnold server")
         self._server.serve_forever()
 
@@ -179,20 +261,38 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
         :returns: List of Regex Callbacks to add
         :return type: list[RegexCallback]
         """
-        callback_list = []
-        completed_regexes = [re.compile("ArnoldClient: Finished Rendering Frame [0-9]+")]
-        progress_regexes = [re.compile("\\[PROGRESS\\] ([0-9]+) percent")]
-        error_regexes = [re.compile(".*Exception:.*|.*Error:.*|.*Warning.*")]
-
-        callback_list.append(RegexCallback(completed_regexes, self._handle_complete))
-        callback_list.append(RegexCallback(progress_regexes, self._handle_progress))
+        # A single alternation with named groups means each stdout line is scanned once
+        # and the handler is picked with a group lookup, instead of running three
+        # separate patterns per line.
+        patterns = [
+            "(?P<complete>ArnoldClient: Finished Rendering Frame [0-9]+)",
+            "(?P<progress>\\[PROGRESS\\] (?P<progress_percent>[0-9]+) percent)",
+        ]
         if self.init_data.get("strict_error_checking", True):
             _logger.info("Enabling strict error checking")
-            callback_list.append(RegexCallback(error_regexes, self._handle_error))
+            # No leading .* -- re.search already scans the line, so anchoring at the
+            # keyword avoids quadratic backtracking on long verbose lines.
+            patterns.append("(?P<error>(?:Exception|Error):.*|Warning.*)")
+        self._combined_regex = re.compile("|".join(patterns))
+
+        return [RegexCallback([self._combined_regex], self._dispatch_regex_match)]
+
+    def _dispatch_regex_match(self, match: re.Match) -> None:
+        """
+        Dispatches a combined-regex match to the handler for whichever named group matched.
 
-        return callback_list
+        :param match: The match object from the combined regex pattern that has matched
+        the message
+        :type match: (re.Match)
+        """
+        groups = match.groupdict()
+        if groups["complete"] is not None:
+            self._handle_complete(match)
+        elif groups["progress"] is not None:
+            self._handle_progress(match)
+        elif groups.get("error") is not None:
+            self._handle_error(match)
 
-    @_check_for_exception
     def _handle_complete(self, match: re.Match) -> None:
         """
         Callback for stdout that indicate completeness of a render. Updates progress to 100
@@ -201,10 +301,12 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
         the message
         :type match: (re.Match)
         """
+        if self._exc_info_set:
+            return
         self._arnold_is_rendering = False
+        self._events.set("render_done")
         self.update_status(progress=100)
 
-    @_check_for_exception
     def _handle_progress(self, match: re.Match) -> None:
         """
         Callback for stdout that indicate progress of a render.
@@ -213,7 +315,9 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
         the message
         :type match: (re.Match)
         """
-        progress = int(match.groups()[0])
+        if self._exc_info_set:
+            return
+        progress = int(match.group("progress_percent"))
         self.update_status(progress=progress)
 
     def _handle_error(self, match: re.Match) -> None:
@@ -227,11 +331,14 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
         adaptor.
         """
         self._exc_info = RuntimeError(f"Arnold Kick Encountered an Error: {match.group(0)}")
+        self._exc_info_set = 1
+        self._events.set("error")
 
-    @property
+    @functools.cached_property
     def arnold_client_path(self) -> str:
         """
-        Obtains the arnold_client.py path by searching directories in sys.path
+        Obtains the arnold_client.py path by searching directories in sys.path.
+        The search is performed once per process; the result is cached.
 
         :raises: FileNotFoundError: If the arnold_client.py file could not be found.
 
@@ -255,41 +362,74 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
 
         :raises: FileNotFoundError: If the arnold_client.py file could not be found.
         """
-        regexhandler = RegexHandler(self._get_regex_callbacks())
+        # The batching wrapper scans stdout on its own thread so the pipe-drain thread
+        # never blocks on regex work during verbose Arnold output.
+        self._stdout_handler = regexhandler = BatchingRegexHandler(
+            RegexHandler(self._get_regex_callbacks())
+        )
 
         # Add the openjd namespace directory to PYTHONPATH, so that adaptor_runtime_client will be available
         # directly to the adaptor client.
-        import openjd.adaptor_runtime_client
-        import deadline.arnold_adaptor
-
-        openjd_namespace_dir = os.path.dirname(
-            os.path.dirname(openjd.adaptor_runtime_client.__file__)
-        )
-        deadline_namespace_dir = os.path.dirname(os.path.dirname(deadline.arnold_adaptor.__file__))
-        python_path_addition = f"{openjd_namespace_dir}{os.pathsep}{deadline_namespace_dir}"
-        if "PYTHONPATH" in os.environ:
-            os.environ["PYTHONPATH"] = (
-                f"{os.environ['PYTHONPATH']}{os.pathsep}{python_path_addition}"
+        os.environ["PYTHONPATH"] = os.pathsep.join(
+            filter(
+                None,
+                [os.environ.get("PYTHONPATH"), _OPENJD_NAMESPACE_DIR, _DEADLINE_NAMESPACE_DIR],
             )
-        else:
-            os.environ["PYTHONPATH"] = python_path_addition
+        )
 
         # start arnold client python script
+        self._events.clear("client_exited")
         self._arnold_client = LoggingSubprocess(
             args=["python", self.arnold_client_path],
             stdout_handler=regexhandler,
             stderr_handler=regexhandler,
         )
 
+        # Signal the client-exited flag from SIGCHLD so the wait loops wake on process
+        # exit instead of polling is_running (a waitpid syscall per tick). SIGCHLD does
+        # not exist on Windows, and handlers can only be installed from the main thread.
+        if hasattr(signal, "SIGCHLD"):
+            try:
+                signal.signal(signal.SIGCHLD, self._handle_client_exited)
+                self._sigchld_installed = True
+            except ValueError:
+                _logger.debug(
+                    "Could not install a SIGCHLD handler outside the main thread; "
+                    "falling back to timed polling for client exit"
+                )
+
+    def _handle_client_exited(self, signum: int, frame) -> None:
+        """
+        SIGCHLD handler that raises the client-exited flag to wake any wait loops.
+
+        :param signum: The signal number received.
+        :type signum: int
+        :param frame: The interrupted stack frame.
+        """
+        # SIGCHLD is also delivered when a child is stopped or continued (e.g. the
+        # farm agent suspending the task). The flag is level-triggered, so only raise
+        # it once the client has really exited; otherwise the timeout-less wait loops
+        # would spin for the whole suspension.
+        if self._arnold_client is not None and not self._arnold_client.is_running:
+            self._events.set("client_exited")
+
     def _populate_action_queue(self) -> None:
         """
         Populates the adaptor server's action queue with actions from the init_data that the Arnold Kick Client will
         request and perform. The action must be present in the _FIRST_ARNOLD_ACTIONS or _ARNOLD_INIT_KEYS set to be
         added to the action queue.
+
+        All init keys are sent as a single "init_bulk" action so the client applies them in one
+        IPC round-trip instead of requesting each one individually.
         """
-        for action_name in _ARNOLD_INIT_KEYS:
-            if action_name in self.init_data:
-                self._action_queue.enqueue_action(self._action_from_action_item(action_name))
+        # C-level set intersection picks out the init keys in one pass instead of a
+        # per-key membership probe
+        init_items = {
+            action_name: self.init_data[action_name]
+            for action_name in self.init_data.keys() & _ARNOLD_INIT_KEYS
+        }
+        if init_items:
+            self._action_queue.enqueue_action(Action("init_bulk", init_items))
 
         # self._action_queue.enqueue_action(
         #     Action(
@@ -314,26 +454,25 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
           - FileNotFoundError: If the arnold_client.py file could not be found.
         """
         # Validate init data against schema
-        cur_dir = os.path.dirname(__file__)
-        schema_dir = os.path.join(cur_dir, "schemas")
-        validators = AdaptorDataValidators.for_adaptor(schema_dir)
-        validators.init_data.validate(self.init_data)
+        self._validators.init_data.validate(self.init_data)
         self.update_status(progress=0, status_message="Initializing Arnold Kick")
         self._start_arnold_server_thread()
         self._populate_action_queue()
         self._start_arnold_client()
 
-        is_not_timed_out = self._get_timer(self._ARNOLD_START_TIMEOUT_SECONDS)
+        deadline = self._get_deadline(self._ARNOLD_START_TIMEOUT_SECONDS)
         while (
             self._arnold_is_running
             and not self._has_exception
             and len(self._action_queue) > 0
-            and is_not_timed_out()
+            and time.monotonic() < deadline
         ):
-            time.sleep(0.1)  # Busy wait for Arnold Kick to finish initialization
+            # Wait for Arnold Kick to finish initialization. The error and client-exit
+            # flags wake this loop immediately instead of on the next tick.
+            self._events.wait_any(("error", "client_exited"), timeout=0.1)
 
         if len(self._action_queue) > 0:
-            if is_not_timed_out():
+            if time.monotonic() < deadline:
                 raise RuntimeError(
                     "Arnold Kick encountered an error and was not able to complete initialization actions."
                 )
@@ -351,16 +490,20 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
             raise ArnoldNotRunningError("Cannot render because Arnold Kick is not running.")
 
         # Validate run data against schema
-        cur_dir = os.path.dirname(__file__)
-        schema_dir = os.path.join(cur_dir, "schemas")
-        validators = AdaptorDataValidators.for_adaptor(schema_dir)
-        validators.run_data.validate(run_data)
+        self._validators.run_data.validate(run_data)
 
         self._arnold_is_rendering = True
+        self._events.clear("render_done")
         self._action_queue.enqueue_action(Action("start_render", run_data))
 
+        # SIGCHLD wakes this loop as soon as the client exits, but delivery is only a
+        # latency optimization: the handler can read is_running as True while the
+        # runtime's own reaping thread holds the waitpid lock, and no second signal
+        # follows. A bounded timeout re-checks the loop condition so a crashed client
+        # that emitted no sentinel still gets noticed.
+        wait_timeout = 0.5 if self._sigchld_installed else 0.1
         while self._arnold_is_rendering and not self._has_exception:
-            time.sleep(0.1)  # wait for the render to finish
+            self._events.wait_any(("render_done", "error", "client_exited"), timeout=wait_timeout)
 
         if (
             not self._arnold_is_running and self._arnold_client
@@ -385,15 +528,24 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
         self._performing_cleanup = True
 
         self._action_queue.enqueue_action(Action("close"), front=True)
-        is_not_timed_out = self._get_timer(self._ARNOLD_END_TIMEOUT_SECONDS)
-        while self._arnold_is_running and is_not_timed_out():
-            time.sleep(0.1)
+        deadline = self._get_deadline(self._ARNOLD_END_TIMEOUT_SECONDS)
+        while self._arnold_is_running and time.monotonic() < deadline:
+            # Wakes immediately once the client-exit flag is signalled; the bound keeps
+            # a missed SIGCHLD from stalling the wait for the whole end timeout
+            if self._sigchld_installed:
+                wait_timeout = min(0.5, max(deadline - time.monotonic(), 0.0))
+            else:
+                wait_timeout = 0.1
+            self._events.wait_any(("client_exited",), timeout=wait_timeout)
         if self._arnold_is_running and self._arnold_client:
             _logger.error(
                 "Arnold Kick did not complete cleanup actions and failed to gracefully shutdown. Terminating."
             )
             self._arnold_client.terminate()
 
+        if self._stdout_handler:
+            self._stdout_handler.close()
+
         if self._server:
             self._server.shutdown()
 
@@ -414,10 +566,3 @@ class ArnoldAdaptor(Adaptor[AdaptorConfiguration]):
 
         # Terminate immediately since the Arnold Kick client does not have a graceful shutdown
         self._arnold_client.terminate(grace_time_s=0)
-
-    def _action_from_action_item(self, item_name: str) -> Action:
-        _logger.debug(f"____action made for {item_name}_______")
-        return Action(
-            item_name,
-            {item_name: self.init_data[item_name]},
-        )
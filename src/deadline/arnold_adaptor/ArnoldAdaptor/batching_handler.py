@@ -0,0 +1,90 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import logging
+import threading
+
+
+class BatchingRegexHandler(logging.Handler):
+    """
+    logging.Handler that decouples draining the subprocess pipe from regex scanning.
+
+    The subprocess-read thread only appends each record to the active one of two
+    bounded line buffers under a lock; a worker thread periodically swaps the buffers
+    and runs the wrapped RegexHandler over the whole drained batch. This keeps the
+    pipe-drain thread from blocking on regex work when Arnold is emitting verbose
+    output, while the flush interval keeps sentinel lines (render complete, errors)
+    timely for the adaptor's wait loops.
+    """
+
+    # Scan at least this often so sentinel lines are seen promptly
+    _FLUSH_INTERVAL_SECONDS = 0.05
+    # Wake the scanner early once this many lines are buffered
+    _BATCH_LINE_THRESHOLD = 1024
+
+    def __init__(self, regex_handler: logging.Handler) -> None:
+        super().__init__()
+        self._regex_handler = regex_handler
+        self._buffers: tuple[list, list] = ([], [])
+        self._active = 0
+        self._swap_lock = threading.Lock()
+        self._data_ready = threading.Event()
+        self._stopping = False
+        self._worker = threading.Thread(
+            target=self._scan_loop, name="ArnoldAdaptorRegexScanThread", daemon=True
+        )
+        self._worker.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Appends a record to the active buffer. Called from the subprocess-read thread;
+        does no regex work so the pipe never backs up on scanning.
+
+        :param record: The log record for one line of subprocess output.
+        :type record: logging.LogRecord
+        """
+        with self._swap_lock:
+            buffer = self._buffers[self._active]
+            buffer.append(record)
+            buffered = len(buffer)
+        if buffered >= self._BATCH_LINE_THRESHOLD:
+            self._data_ready.set()
+
+    def _scan_loop(self) -> None:
+        """
+        Worker loop: swaps the ping-pong buffers and scans the drained batch with the
+        wrapped handler, amortizing per-line overhead across the whole batch.
+        """
+        while not self._stopping:
+            self._data_ready.wait(timeout=self._FLUSH_INTERVAL_SECONDS)
+            self._data_ready.clear()
+            self._scan_batch()
+
+    def _scan_batch(self) -> None:
+        with self._swap_lock:
+            drained = self._buffers[self._active]
+            self._active = 1 - self._active
+        for record in drained:
+            # A raising callback must not kill the scan thread: every later line
+            # (including the completion sentinel) would be silently dropped
+            try:
+                self._regex_handler.emit(record)
+            except Exception:
+                self.handleError(record)
+        with self._swap_lock:
+            drained.clear()
+
+    def close(self) -> None:
+        """
+        Stops the worker thread and scans any remaining buffered output.
+        """
+        self._stopping = True
+        self._data_ready.set()
+        # Wait for the worker to finish outright so the final drain below never swaps
+        # buffers concurrently with a scan still in flight
+        self._worker.join()
+        # Scan both buffers so no trailing output is dropped
+        self._scan_batch()
+        self._scan_batch()
+        super().close()
@@ -1,6 +1,26 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
-from .arnold_client import ArnoldClient
-from .arnold_handler import ArnoldHandler
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .arnold_client import ArnoldClient
+    from .arnold_handler import ArnoldHandler
 
 __all__ = ["ArnoldClient", "ArnoldHandler"]
+
+# The submodules are imported lazily so that importing the package namespace alone does
+# not pay for the client/handler module imports.
+_LAZY_SUBMODULES = {
+    "ArnoldClient": ".arnold_client",
+    "ArnoldHandler": ".arnold_handler",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(_LAZY_SUBMODULES[name], __package__)
+        attr = getattr(module, name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
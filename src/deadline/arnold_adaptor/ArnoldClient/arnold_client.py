@@ -11,17 +11,8 @@ from typing import Optional
 
 try:
     from adaptor_runtime_client import ClientInterface  # type: ignore[import]
-    from adaptor_runtime.process import LoggingSubprocess
-    from adaptor_runtime.app_handlers import RegexHandler
 except (ImportError, ModuleNotFoundError):
     from openjd.adaptor_runtime_client import ClientInterface  # type: ignore[import]
-    from openjd.adaptor_runtime.process import LoggingSubprocess
-    from openjd.adaptor_runtime.app_handlers import RegexHandler
-
-
-from openjd.adaptor_runtime_client import (
-    ClientInterface,
-)
 
 from deadline.arnold_adaptor.ArnoldClient.arnold_handler import ArnoldHandler
 
@@ -30,14 +21,14 @@ class ArnoldClient(ClientInterface):
     def __init__(self, server_path: str) -> None:
         super().__init__(server_path)
         # List of actions that can be performed by the action queue
-        handler = ArnoldHandler(lambda path: self.map_path(path))
-        self.actions.update(handler.action_dict)
+        self.handler = ArnoldHandler(lambda path: self.map_path(path))
+        self.actions.update(self.handler.action_dict)
 
     def close(self, args: Optional[dict] = None) -> None:
-        pass
+        self.handler.shutdown()
 
     def graceful_shutdown(self, signum: int, frame: FrameType | None):
-        pass
+        self.handler.shutdown()
 
 # "kick.exe
 #       -nstdin
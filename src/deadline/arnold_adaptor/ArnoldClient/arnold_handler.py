@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import re
 import os
+import stat
 import subprocess
+import sys
 from typing import TYPE_CHECKING, Any, Callable, Dict, List
 from openjd.adaptor_runtime.process import LoggingSubprocess
 from openjd.adaptor_runtime.app_handlers import RegexCallback, RegexHandler
-# try:
-#     import arnold
-# except ImportError:  # pragma: no cover
-#     raise OSError("Could not find the arnold module. Are you running this inside of arnold?")
+
+# When the arnold Python module is available we render in-process so the scene is parsed
+# and licensed once and stays resident between frames. Otherwise fall back to spawning
+# kick per frame.
+try:
+    import arnold
+except (ImportError, ModuleNotFoundError):  # pragma: no cover
+    arnold = None
 
 
 class ArnoldHandler:
@@ -30,12 +37,53 @@ class ArnoldHandler:
             "start_render": self.start_render,
             "scene_file": self.set_scene_file,
             "output_file_path": self.set_output_file_path,
+            "init_bulk": self.init_bulk,
         }
         self.render_kwargs = {"continueOnError": True}
         self.scene_file = None
         self.output_path = None
         self.error_on_arnold_license_fail = "true"
-        self.map_path = map_path
+        # map_path is an IPC round-trip to the Adaptor; mapping rules are immutable for
+        # the lifetime of a task, so repeated lookups of the same path are cached.
+        self.map_path = functools.lru_cache(maxsize=4096)(map_path)
+        # In-process rendering is opt-in: the arnold module must be importable and the
+        # farm must set ARNOLD_ADAPTOR_IN_PROCESS_RENDER=1, since the calls in
+        # _render_frame_in_process use the Arnold 6 global-universe signatures and
+        # raise TypeError on Arnold 7+.
+        self._use_in_process_render = (
+            arnold is not None and os.environ.get("ARNOLD_ADAPTOR_IN_PROCESS_RENDER") == "1"
+        )
+        self._arnold_session_active = False
+        self._loaded_scene_file = None
+
+    def init_bulk(self, data: dict) -> None:
+        """
+        Applies a batch of init-data settings sent by the Adaptor as one action.
+
+        :param data: The data given from the Adaptor. Each key is the name of an init action
+        ('scene_file', 'output_file_path', ...) mapped to the value for that setting.
+        :type data: dict
+        """
+        for name, value in data.items():
+            handler = self.action_dict.get(name)
+            if handler is None or handler is self.init_bulk:
+                continue
+            handler({name: value})
+
+    @staticmethod
+    def _is_regular_file(path) -> bool:
+        """
+        Checks whether path is a regular file with a single os.stat call.
+
+        :param path: The path to probe.
+
+        :returns: True if the path exists and is a regular file, False otherwise.
+        :return type: bool
+        """
+        try:
+            return stat.S_ISREG(os.stat(path).st_mode)
+        except (OSError, TypeError, ValueError):
+            return False
 
     def set_scene_file(self, data: dict):
         """
@@ -46,25 +94,22 @@ class ArnoldHandler:
         :raises: FileNotFoundError: If the file provided in the data dictionary does not exist.
         """
         self.scene_file = data.get("scene_file", "")
-        if os.path.isfile(self.scene_file):
+        if self._is_regular_file(self.scene_file):
             return
 
         self.scene_file = self.map_path(self.scene_file)
-        if not os.path.isfile(self.scene_file):
+        if not self._is_regular_file(self.scene_file):
             raise FileNotFoundError(f"Error: The scene file '{self.scene_file}' does not exist")
 
     def set_output_file_path(self, data: dict) -> None:
         """
-        Sets the output file path.
+        Sets the output file path. No existence check is made here -- the output does not
+        exist yet on a fresh render, so a stat would only ever cost a syscall.
 
         :param data: The data given from the Adaptor. Keys expected: ['output_file_path']
         :type data: dict
         """
-        self.output_path = data.get("output_file_path")
-        if os.path.isfile(self.output_path):
-            return
-
-        self.output_path = self.map_path(self.output_path)
+        self.output_path = self.map_path(data.get("output_file_path"))
 
     # "kick.exe
     #       -nstdin
@@ -84,6 +129,79 @@ class ArnoldHandler:
         """
 
         frame = data.get("frame")
+        if self._use_in_process_render:
+            try:
+                self._render_frame_in_process(frame)
+                return
+            except Exception as exc:
+                # Most likely an Arnold API mismatch (the signatures above changed in
+                # Arnold 7); disable the in-process path for the rest of the task and
+                # render this and later frames with kick instead of dying per frame
+                print(
+                    "ArnoldClient: in-process render unavailable (%s); "
+                    "falling back to the kick executable" % exc,
+                    flush=True,
+                )
+                self._use_in_process_render = False
+                try:
+                    self.shutdown()
+                except Exception:
+                    self._arnold_session_active = False
+        self._render_frame_with_kick(frame)
+
+    def _render_frame_in_process(self, frame) -> None:
+        """
+        Renders a frame with the arnold Python API in this process. The scene is loaded
+        once and kept resident, so license checks and scene parsing amortize across every
+        frame of the task instead of being paid per frame.
+
+        Args:
+            frame: The frame number to render.
+        """
+        if not self._arnold_session_active:
+            arnold.AiBegin()
+            self._arnold_session_active = True
+        if self._loaded_scene_file != self.scene_file:
+            arnold.AiASSLoad(self.scene_file, arnold.AI_NODE_ALL)
+            self._loaded_scene_file = self.scene_file
+
+        options = arnold.AiUniverseGetOptions()
+        arnold.AiNodeSetFlt(options, "frame", float(frame))
+        arnold.AiNodeSetBool(options, "abort_on_license_fail", self.error_on_arnold_license_fail == "true")
+
+        # Point every output driver at the requested output path, mirroring kick's -o flag
+        iterator = arnold.AiUniverseGetNodeIterator(arnold.AI_NODE_DRIVER)
+        while not arnold.AiNodeIteratorFinished(iterator):
+            driver = arnold.AiNodeIteratorGetNext(iterator)
+            if arnold.AiNodeEntryLookUpParameter(arnold.AiNodeGetNodeEntry(driver), "filename"):
+                arnold.AiNodeSetStr(driver, "filename", self.output_path)
+        arnold.AiNodeIteratorDestroy(iterator)
+
+        print(f"Rendering Frame: {frame}", flush=True)
+        status = arnold.AiRender(arnold.AI_RENDER_MODE_CAMERA)
+        if status != arnold.AI_SUCCESS:
+            # "Error:" is the token the Adaptor's error regex keys on
+            print("ArnoldClient Error: in-process render failed, status %s" % status, flush=True)
+            return
+        print(f"ArnoldClient: Finished Rendering Frame {frame}\n", flush=True)
+
+    def shutdown(self) -> None:
+        """
+        Ends the in-process Arnold session if one was started.
+        """
+        if self._arnold_session_active:
+            arnold.AiEnd()
+            self._arnold_session_active = False
+            self._loaded_scene_file = None
+
+    def _render_frame_with_kick(self, frame) -> None:
+        """
+        Renders a frame by spawning the kick executable. Fallback path used when the
+        arnold Python module is not importable.
+
+        Args:
+            frame: The frame number to render.
+        """
         kick_exe = os.environ.get("ARNOLD_ADAPTOR_KICK_EXECUTABLE", "kick")
         arguments = [
             "-nstdin",
@@ -96,11 +214,16 @@ class ArnoldHandler:
             "-set", "options.abort_on_license_fail", self.error_on_arnold_license_fail,
         ]
 
-        print("Calling: %s" % ([kick_exe,] + arguments))
-        print(f"Rendering Frame: {frame}", flush=True)
+        # One write + one flush for the pre-render lines; each flush is a syscall and
+        # the adaptor only needs them together before kick's own output starts.
+        sys.stdout.write(
+            "Calling: %s\nRendering Frame: %s\n" % ([kick_exe] + arguments, frame)
+        )
+        sys.stdout.flush()
         result = subprocess.run([kick_exe] + arguments)
         if result.returncode != 0:
-            print("ArnoldClient: Error rendering with kick executable: %s" % kick_exe, flush=True)
+            # "Error:" is the token the Adaptor's error regex keys on
+            print("ArnoldClient Error: kick render failed, executable %s" % kick_exe, flush=True)
             return
         print(f"ArnoldClient: Finished Rendering Frame {frame}\n", flush=True)
 
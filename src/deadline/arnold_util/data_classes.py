@@ -6,6 +6,13 @@ from dataclasses import dataclass, field
 from pathlib import Path
 import json
 
+# orjson parses/serializes JSON several times faster than the stdlib; fall back to the
+# stdlib when it is not installed in the host environment.
+try:
+    import orjson
+except (ImportError, ModuleNotFoundError):
+    orjson = None
+
 RENDER_SUBMITTER_SETTINGS_FILE_EXT = ".deadline_render_settings.arnold.json"
 
 @dataclass
@@ -28,18 +35,14 @@ class ArnoldRenderUISettings:
         )
         if sticky_settings_filename.exists() and sticky_settings_filename.is_file():
             try:
-                with open(sticky_settings_filename, encoding="utf8") as fh:
-                    sticky_settings = json.load(fh)
+                with open(sticky_settings_filename, "rb") as fh:
+                    raw = fh.read()
+                sticky_settings = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
                 if isinstance(sticky_settings, dict):
-                    sticky_fields = {
-                        field.name: field
-                        for field in dataclasses.fields(self)
-                        if field.metadata.get("sticky")
-                    }
                     for name, value in sticky_settings.items():
                         # Only set fields that are defined in the dataclass
-                        if name in sticky_fields:
+                        if name in _STICKY_FIELD_NAMES:
                             setattr(self, name, value)
             except (OSError, json.JSONDecodeError):
                 # If something bad happened to the sticky settings file,
@@ -56,10 +59,18 @@ class ArnoldRenderUISettings:
         sticky_settings_filename = Path(scene_filename).with_suffix(
             RENDER_SUBMITTER_SETTINGS_FILE_EXT
         )
-        with open(sticky_settings_filename, "w", encoding="utf8") as fh:
-            obj = {
-                field.name: getattr(self, field.name)
-                for field in dataclasses.fields(self)
-                if field.metadata.get("sticky")
-            }
-            json.dump(obj, fh, indent=1)
+        obj = {name: getattr(self, name) for name in _STICKY_FIELD_NAMES}
+        if orjson is not None:
+            with open(sticky_settings_filename, "wb") as fh:
+                fh.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        else:
+            with open(sticky_settings_filename, "w", encoding="utf8") as fh:
+                json.dump(obj, fh, indent=1)
+
+
+# Computed once at import time so load/save don't walk the dataclass metadata per call
+_STICKY_FIELD_NAMES = tuple(
+    field.name
+    for field in dataclasses.fields(ArnoldRenderUISettings)
+    if field.metadata.get("sticky")
+)
@@ -1,19 +1,31 @@
+import os
+
 from qtpy import QtWidgets, QtCore
 
 from ..data_classes import ArnoldRenderUISettings
 
+# Qt's subtractOpaqueSiblings repaint optimization costs more than it saves for this
+# non-overlapping form (it is flagged "too expensive" in Qt's own source). setdefault
+# leaves a host DCC that configured the variable itself alone, and setting
+# ARNOLD_SUBMITTER_KEEP_OPAQUE_SIBLINGS opts out of touching it at all.
+if not os.environ.get("ARNOLD_SUBMITTER_KEEP_OPAQUE_SIBLINGS"):
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
+
 
 class ArnoldSubmitterPluginWidget(QtWidgets.QWidget):
-    _CHECKBOX_GROUPBOX_STYLESHEET = """QGroupBox { 
-    font: bold; 
-    border: 1px solid silver; 
-    border-radius: 6px; 
-    margin-top: 6px; 
-} 
-QGroupBox::title { 
-    subcontrol-origin: margin; 
-    left: 7px; 
-    padding: 0px 5px 0px 5px; 
+    # Scoped by object name and set on the group box itself, so the rules cannot leak
+    # onto other widgets and never touch the host application's stylesheet
+    _CHECKBOX_GROUPBOX_OBJECT_NAME = "arnoldExportGroupBox"
+    _CHECKBOX_GROUPBOX_STYLESHEET = """QGroupBox#arnoldExportGroupBox {
+    font: bold;
+    border: 1px solid silver;
+    border-radius: 6px;
+    margin-top: 6px;
+}
+QGroupBox#arnoldExportGroupBox::title {
+    subcontrol-origin: margin;
+    left: 7px;
+    padding: 0px 5px 0px 5px;
 }"""
 
     _EXPORT_ALL_SHADING_GROUPS_TOOLTIP = (
@@ -45,32 +57,65 @@ QGroupBox::title {
     SHADOW_LINKING_FOLLOW_LIGHT = "Follows Light Linking"
     SHADOW_LINKING_MAYA = "Maya Shadow Links"
 
+    # Maps widget objectName -> ArnoldRenderUISettings attribute for the two shared
+    # dispatch slots below
+    _CHECKBOX_ATTR = {
+        _CHECKBOX_GROUPBOX_OBJECT_NAME: "arnold_export",
+        "exportAllShadingGroupsCheckbox": "export_all_shading_groups",
+        "expandProceduralsCheckbox": "expand_procedurals",
+        "exportFullPathsCheckbox": "export_full_paths",
+    }
+    _COMBOBOX_ATTR = {
+        "lightLinkingCombobox": "light_linking",
+        "shadowLinkingCombobox": "shadow_linking",
+    }
+
     def __init__(self, parent=None, settings=None, scene_file=None):
         super(ArnoldSubmitterPluginWidget, self).__init__(parent)
         self.settings = settings
-        self._label_container = None
-        self._label = None
-        self._checkbox_groupbox = None
-
-        self._export_all_shading_groups_checkbox = None
-        self._expand_procedurals_checkbox = None
-        self._export_full_paths_checkbox = None
 
-        self._line = None
-
-        self._light_Linking_label = None
-        self._light_linking_combobox = None
-
-        self._shadow_linking_label = None
-        self._shadow_linking_combobox = None
-
-        self.settings.plugins.arnold_plugin = ArnoldRenderUISettings()
-        self.settings.plugins.arnold_plugin.load_sticky_settings(scene_file)
+        # Keep a direct reference so signal handlers don't re-walk the plugins chain
+        # on every emission
+        self._plugin = ArnoldRenderUISettings()
+        self.settings.plugins.arnold_plugin = self._plugin
+        self._scene_file = scene_file
+        self._sticky_loaded = False
 
         self.build_ui()
+        # Defer the sticky-settings disk read to the event loop so the dialog paints
+        # without blocking on file I/O
+        QtCore.QTimer.singleShot(0, self._load_sticky_settings)
+
+    @QtCore.Slot()
+    def _load_sticky_settings(self):
+        self._plugin.load_sticky_settings(self._scene_file)
+        self._sticky_loaded = True
+        if self._plugin.arnold_export:
+            # setChecked emits toggled, which builds the group-box contents; clicked is
+            # not emitted programmatically, so nothing writes back into the settings
+            self._checkbox_groupbox.setChecked(True)
+            self._apply_settings_to_widgets()
+
+    def _apply_settings_to_widgets(self):
+        plugin = self._plugin
+        for widget, checked in (
+            (self._export_all_shading_groups_checkbox, plugin.export_all_shading_groups),
+            (self._expand_procedurals_checkbox, plugin.expand_procedurals),
+            (self._export_full_paths_checkbox, plugin.export_full_paths),
+        ):
+            widget.blockSignals(True)
+            widget.setChecked(checked)
+            widget.blockSignals(False)
+        for widget, text in (
+            (self._light_linking_combobox, plugin.light_linking),
+            (self._shadow_linking_combobox, plugin.shadow_linking),
+        ):
+            widget.blockSignals(True)
+            widget.setCurrentText(text)
+            widget.blockSignals(False)
 
     def get_settings(self):
-        return self.settings.plugins.arnold_plugin
+        return self._plugin
 
     @property
     def checkbox(self):
@@ -78,37 +123,92 @@ QGroupBox::title {
 
     def build_ui(self):
         self.setWindowTitle("Arnold Plugin")
-        self.setLayout(QtWidgets.QVBoxLayout())
-        self.layout().setContentsMargins(0, 0, 0, 0)
-        self.layout().setSpacing(0)
-
-        self._label_container = self._build_header_label()
-
-        self._checkbox_groupbox = self._build_groupbox()
-
-        self.layout().addWidget(self._label_container)
-        self.layout().addWidget(self._checkbox_groupbox)
+        # Suppress repaints while the tree is assembled; each addWidget can otherwise
+        # post an update that the next one immediately invalidates
+        self.setUpdatesEnabled(False)
+        try:
+            # Keep the layout in a local; every self.layout() call crosses into the C++ object
+            vbox = QtWidgets.QVBoxLayout()
+            self.setLayout(vbox)
+            vbox.setContentsMargins(0, 0, 0, 0)
+            vbox.setSpacing(0)
+
+            self._label = self._build_header_label()
+
+            self._checkbox_groupbox = self._build_groupbox()
+
+            vbox.addWidget(self._label)
+            vbox.addWidget(self._checkbox_groupbox)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.updateGeometry()
 
     def _build_header_label(self):
-        self._label_container = QtWidgets.QWidget(self)
-        self._label_container.setLayout(QtWidgets.QHBoxLayout())
-        self._label_container.layout().setContentsMargins(0, 0, 0, 0)
-        self._label_container.layout().setSpacing(0)
-        self._label_container.layout().addStretch()
-        self._label = QtWidgets.QLabel("<h2>Arnold Settings</h2>")
-        self._label_container.layout().addWidget(self._label)
-        self._label_container.layout().addStretch()
-        return self._label_container
+        # A centered alignment on the label itself replaces the container widget,
+        # nested HBox, and two stretches the header used to need, keeping the layout
+        # tree one level shallower
+        # Plain text with an explicit font skips the rich-text parse/layout path an
+        # HTML "<h2>" label would take
+        self._label = QtWidgets.QLabel("Arnold Settings")
+        font = self._label.font()
+        font.setBold(True)
+        # pointSize() is -1 when the inherited font was defined in pixels (some DCC
+        # stylesheets do this); bump whichever unit the font actually carries
+        point_size = font.pointSize()
+        if point_size > 0:
+            font.setPointSize(point_size + 4)
+        else:
+            font.setPixelSize(font.pixelSize() + 5)
+        self._label.setFont(font)
+        self._label.setTextFormat(QtCore.Qt.PlainText)
+        self._label.setAlignment(QtCore.Qt.AlignHCenter)
+        return self._label
 
     def _build_groupbox(self):
         self._checkbox_groupbox = QtWidgets.QGroupBox("Export Arnold Standalone", self)
         self._checkbox_groupbox.setCheckable(True)
         self._checkbox_groupbox.setChecked(False)
-        self._checkbox_groupbox.clicked.connect(self._handle_checkbox_groupbox_clicked)
-        self._checkbox_groupbox.setLayout(QtWidgets.QGridLayout())
+        self._checkbox_groupbox.clicked.connect(self._on_checkbox_toggled, QtCore.Qt.DirectConnection)
+        grid = QtWidgets.QGridLayout()
+        self._checkbox_groupbox.setLayout(grid)
         self._checkbox_groupbox.setFlat(False)
+        self._checkbox_groupbox.setObjectName(self._CHECKBOX_GROUPBOX_OBJECT_NAME)
+        # Scoped to the group box's object name and set on the group box itself: the
+        # rules never touch the host application's stylesheet, so no app-wide
+        # re-polish and no loss of styling if the DCC replaces its stylesheet later
         self._checkbox_groupbox.setStyleSheet(self._CHECKBOX_GROUPBOX_STYLESHEET)
 
+        # The box starts unchecked (the default submission does not export for Arnold
+        # Standalone), so its contents are only built the first time it is checked.
+        # The settings defaults live on the data class, not the widgets, so an
+        # untouched group box still submits correctly.
+        self._groupbox_populated = False
+        self._checkbox_groupbox.toggled.connect(self._populate_groupbox_once, QtCore.Qt.DirectConnection)
+        return self._checkbox_groupbox
+
+    @QtCore.Slot(bool)
+    def _populate_groupbox_once(self, checked):
+        if not checked or self._groupbox_populated:
+            return
+        self._checkbox_groupbox.toggled.disconnect(self._populate_groupbox_once)
+        self._groupbox_populated = True
+        self._populate_groupbox()
+        # The freshly built children default to checked/index 1; once sticky settings
+        # have been loaded the widgets must show those values, or a box checked by the
+        # user after a sticky load with arnold_export unset would submit settings the
+        # UI does not display
+        if self._sticky_loaded:
+            self._apply_settings_to_widgets()
+
+    def _populate_groupbox(self):
+        self._checkbox_groupbox.setUpdatesEnabled(False)
+        try:
+            self._do_populate_groupbox()
+        finally:
+            self._checkbox_groupbox.setUpdatesEnabled(True)
+        self._checkbox_groupbox.updateGeometry()
+
+    def _do_populate_groupbox(self):
         self._export_all_shading_groups_checkbox = self._build_shading_groups_checkbox()
         self._expand_procedurals_checkbox = self._build_expand_procedurals_checkbox()
         self._export_full_paths_checkbox = self._build_export_full_paths_checkbox()
@@ -121,74 +221,77 @@ QGroupBox::title {
         self._line.setFrameShadow(QtWidgets.QFrame.Sunken)
 
         _widget = QtWidgets.QWidget(self._checkbox_groupbox)
-        self._checkbox_groupbox.layout().addWidget(_widget, 0, 0, 1, -1)
+        grid = self._checkbox_groupbox.layout()
+        grid.addWidget(_widget, 0, 0, 1, -1)
 
-        self._checkbox_groupbox.layout().addWidget(self._export_all_shading_groups_checkbox, 1, 0, 1, 2)
-        self._checkbox_groupbox.layout().addWidget(self._expand_procedurals_checkbox, 1, 3, 1, 2)
-        self._checkbox_groupbox.layout().addWidget(self._export_full_paths_checkbox, 2, 0, 1, 2)
-        self._checkbox_groupbox.layout().addWidget(self._export_full_paths_checkbox, 2, 0, 1, 2)
+        grid.addWidget(self._export_all_shading_groups_checkbox, 1, 0, 1, 2)
+        grid.addWidget(self._expand_procedurals_checkbox, 1, 3, 1, 2)
+        grid.addWidget(self._export_full_paths_checkbox, 2, 0, 1, 2)
 
-        self._checkbox_groupbox.layout().addWidget(self._line, 3, 0, 1, -1)
+        grid.addWidget(self._line, 3, 0, 1, -1)
 
-        self._checkbox_groupbox.layout().addWidget(self._light_Linking_label, 4, 0, 1, 1)
-        self._checkbox_groupbox.layout().addWidget(self._light_linking_combobox, 4, 1, 1, -1)
-        self._checkbox_groupbox.layout().addWidget(self._shadow_linking_label, 5, 0, 1, 1)
-        self._checkbox_groupbox.layout().addWidget(self._shadow_linking_combobox, 5, 1, 1, -1)
-        return self._checkbox_groupbox
+        grid.addWidget(self._light_Linking_label, 4, 0, 1, 1)
+        grid.addWidget(self._light_linking_combobox, 4, 1, 1, -1)
+        grid.addWidget(self._shadow_linking_label, 5, 0, 1, 1)
+        grid.addWidget(self._shadow_linking_combobox, 5, 1, 1, -1)
 
     def _build_shading_groups_checkbox(self):
         self._export_all_shading_groups_checkbox = QtWidgets.QCheckBox("Export All Shading Groups", self._checkbox_groupbox)
+        self._export_all_shading_groups_checkbox.setObjectName("exportAllShadingGroupsCheckbox")
         self._export_all_shading_groups_checkbox.setChecked(True)
-        self._export_all_shading_groups_checkbox.clicked.connect(self._handle_export_all_shading_groups_clicked)
+        self._export_all_shading_groups_checkbox.clicked.connect(self._on_checkbox_toggled, QtCore.Qt.DirectConnection)
         self._export_all_shading_groups_checkbox.setToolTip(self._EXPORT_ALL_SHADING_GROUPS_TOOLTIP)
         return self._export_all_shading_groups_checkbox
 
     def _build_expand_procedurals_checkbox(self):
         self._expand_procedurals_checkbox = QtWidgets.QCheckBox("Expand Procedurals", self._checkbox_groupbox)
+        self._expand_procedurals_checkbox.setObjectName("expandProceduralsCheckbox")
         self._expand_procedurals_checkbox.setChecked(True)
-        self._expand_procedurals_checkbox.clicked.connect(self._handle_expand_procedurals_clicked)
+        self._expand_procedurals_checkbox.clicked.connect(self._on_checkbox_toggled, QtCore.Qt.DirectConnection)
         self._expand_procedurals_checkbox.setToolTip(self._EXPAND_PROCEDURALS_TOOLTIP)
         return self._expand_procedurals_checkbox
 
     def _build_export_full_paths_checkbox(self):
         self._export_full_paths_checkbox = QtWidgets.QCheckBox("Export Full Paths", self._checkbox_groupbox)
+        self._export_full_paths_checkbox.setObjectName("exportFullPathsCheckbox")
         self._export_full_paths_checkbox.setChecked(True)
-        self._export_full_paths_checkbox.clicked.connect(self._handle_export_full_paths_clicked)
+        self._export_full_paths_checkbox.clicked.connect(self._on_checkbox_toggled, QtCore.Qt.DirectConnection)
         self._export_full_paths_checkbox.setToolTip(self._EXPORT_FULL_PATHS_TOOLTIP)
         return self._export_full_paths_checkbox
 
     def _build_light_Linking_combobox(self):
         self._light_Linking_label = QtWidgets.QLabel("Light Linking")
         self._light_linking_combobox = QtWidgets.QComboBox(self._checkbox_groupbox)
+        self._light_linking_combobox.setObjectName("lightLinkingCombobox")
+        # Populate and pick the default with signals blocked so no currentTextChanged
+        # emission fires before the widget is fully configured
+        self._light_linking_combobox.blockSignals(True)
         self._light_linking_combobox.addItems([self._NONE, self.LIGHT_LINKING_MAYA])
-        self._light_linking_combobox.setCurrentIndex(self._light_linking_combobox.findText(self.LIGHT_LINKING_MAYA))
-        self._light_linking_combobox.currentTextChanged.connect(self._handle_light_linking_currentTextChanged)
+        # Item order is fixed by the addItems call above; index 1 is LIGHT_LINKING_MAYA
+        self._light_linking_combobox.setCurrentIndex(1)
+        self._light_linking_combobox.blockSignals(False)
+        self._light_linking_combobox.currentTextChanged.connect(self._on_combobox_text_changed, QtCore.Qt.DirectConnection)
         self._light_linking_combobox.setToolTip(self._LIGHT_LINKING_TOOLTIP)
         return self._light_Linking_label, self._light_linking_combobox
 
     def _build_shadow_Linking_combobox(self):
         self._shadow_linking_label = QtWidgets.QLabel("Shadow Linking")
         self._shadow_linking_combobox = QtWidgets.QComboBox(self._checkbox_groupbox)
+        self._shadow_linking_combobox.setObjectName("shadowLinkingCombobox")
+        self._shadow_linking_combobox.blockSignals(True)
         self._shadow_linking_combobox.addItems([self._NONE, self.SHADOW_LINKING_FOLLOW_LIGHT, self.SHADOW_LINKING_MAYA])
-        self._shadow_linking_combobox.setCurrentIndex(self._shadow_linking_combobox.findText(self.SHADOW_LINKING_FOLLOW_LIGHT))
-        self._shadow_linking_combobox.currentTextChanged.connect(self._handle_shadow_linking_currentTextChanged)
+        # Item order is fixed by the addItems call above; index 1 is SHADOW_LINKING_FOLLOW_LIGHT
+        self._shadow_linking_combobox.setCurrentIndex(1)
+        self._shadow_linking_combobox.blockSignals(False)
+        self._shadow_linking_combobox.currentTextChanged.connect(self._on_combobox_text_changed, QtCore.Qt.DirectConnection)
         self._shadow_linking_combobox.setToolTip(self._SHADOW_LINKING_TOOLTIP)
         return self._shadow_linking_label, self._shadow_linking_combobox
 
-    def _handle_checkbox_groupbox_clicked(self, checked: bool):
-        self.get_settings().arnold_export = checked
-
-    def _handle_export_all_shading_groups_clicked(self, checked: bool):
-        self.get_settings().export_all_shading_groups = checked
-
-    def _handle_expand_procedurals_clicked(self, checked: bool):
-        self.get_settings().expand_procedurals = checked
-
-    def _handle_export_full_paths_clicked(self, checked: bool):
-        self.get_settings().export_full_paths = checked
+    @QtCore.Slot(bool)
+    def _on_checkbox_toggled(self, checked: bool):
+        setattr(self._plugin, self._CHECKBOX_ATTR[self.sender().objectName()], checked)
 
-    def _handle_light_linking_currentTextChanged(self, text: str):
-        self.get_settings().light_linking = text
+    @QtCore.Slot(str)
+    def _on_combobox_text_changed(self, text: str):
+        setattr(self._plugin, self._COMBOBOX_ATTR[self.sender().objectName()], text)
 
-    def _handle_shadow_linking_currentTextChanged(self, text: str):
-        self.get_settings().shadow_linking = text
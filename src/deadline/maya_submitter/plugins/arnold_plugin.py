@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import logging
 import os
+import shutil
 from pathlib import Path
 import tempfile
-from copy import deepcopy
+import threading
+import weakref
 from dataclasses import dataclass
 from typing import Any, Optional
 import yaml
@@ -56,8 +60,161 @@ from deadline.maya_submitter import logger
 
 _LOG = logger()
 
+# libyaml-backed C loader when available; pure-Python SafeLoader otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+_DEFAULT_TEMPLATE: Optional[dict[str, Any]] = None
+# Position of each default-template parameter definition by name, filled in when the
+# template is first parsed; the clone in _get_job_template preserves this order
+_DEFAULT_TEMPLATE_PARAM_INDEX: dict[str, int] = {}
+
+
+def _load_default_template() -> dict[str, Any]:
+    """
+    Returns the parsed default Arnold job template, reading and parsing the YAML file
+    only on the first call. The template ships with the package and never changes at
+    runtime, so callers must not mutate the returned dict; _get_job_template clones it
+    before making per-submission edits.
+    """
+    global _DEFAULT_TEMPLATE
+    if _DEFAULT_TEMPLATE is None:
+        with open(Path(arnold_util.__file__).parent / "default_arnold_job_template.yaml") as fh:
+            _DEFAULT_TEMPLATE = yaml.load(fh, Loader=_YamlLoader)
+        _DEFAULT_TEMPLATE_PARAM_INDEX.update(
+            {
+                param["name"]: position
+                for position, param in enumerate(_DEFAULT_TEMPLATE["parameterDefinitions"])
+            }
+        )
+    return _DEFAULT_TEMPLATE
+
+
+# libyaml-backed C dumper when available; pure-Python SafeDumper otherwise
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
+def _dump_job_bundle_yaml(data: Any, stream: Any) -> None:
+    """
+    Writes one job-bundle YAML document with the libyaml C dumper.
+    deadline_yaml_dump pins its own Dumper argument, so it cannot be asked to emit
+    through libyaml; the bundle documents are plain dicts of scalars, lists, and
+    strings, for which yaml.dump with sort_keys=False produces equivalent YAML (only
+    multi-line strings lose the block style).
+    """
+    yaml.dump(data, stream, Dumper=_YamlDumper, sort_keys=False, indent=1)
+
+
+# Cap on the combined size of cached .ass exports; oldest entries past it are removed
+_EXPORT_CACHE_MAX_BYTES = 5 * 1024**3
+
+
+def _prune_export_cache(cache_dir: Path) -> None:
+    """
+    Deletes the oldest cached exports until the cache directory is back under
+    _EXPORT_CACHE_MAX_BYTES. Cache hits refresh an entry's mtime, so mtime order
+    approximates least-recently-used.
+    """
+    entries = []
+    for entry in cache_dir.glob("*.ass"):
+        try:
+            entry_stat = entry.stat()
+        except OSError:
+            continue
+        entries.append((entry_stat.st_mtime, entry_stat.st_size, entry))
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries):
+        if total_bytes <= _EXPORT_CACHE_MAX_BYTES:
+            return
+        try:
+            entry.unlink()
+        except OSError:
+            continue
+        total_bytes -= size
+
+
+# Set once _ensure_arnold_options_loaded has confirmed the defaultArnoldRenderOptions
+# node exists; reset when a different scene is opened
+_arnold_options_loaded = False
+
+# Live plugin instances whose scene-derived caches need clearing on a scene change.
+# Tracked weakly and invalidated by a single pair of scriptJobs registered once per
+# Maya session, so repeated plugin instantiation does not stack up jobs that keep
+# dead instances alive.
+_scene_cache_holders: "weakref.WeakSet[ArnoldPlugin]" = weakref.WeakSet()
+_scene_scriptjobs_registered = False
+
+
+def _invalidate_scene_caches() -> None:
+    global _arnold_options_loaded
+    _arnold_options_loaded = False
+    for plugin in list(_scene_cache_holders):
+        plugin._output_dir_cache.clear()
+
+
+def _register_scene_scriptjobs() -> None:
+    global _scene_scriptjobs_registered
+    if _scene_scriptjobs_registered:
+        return
+    for scene_event in ("SceneOpened", "NewSceneOpened"):
+        maya.cmds.scriptJob(event=[scene_event, _invalidate_scene_caches])
+    _scene_scriptjobs_registered = True
+
+
+def _ensure_arnold_options_loaded() -> None:
+    """
+    Makes sure the defaultArnoldRenderOptions node exists, creating it through mtoa when
+    necessary. Success is remembered so repeat submissions skip the Maya query.
+    """
+    global _arnold_options_loaded
+    if _arnold_options_loaded:
+        return
+    try:
+        maya.cmds.listAttr("defaultArnoldRenderOptions")
+    except ValueError:
+        try:
+            from mtoa.core import createOptions
+
+            createOptions()  # defaultArnoldRenderOptions are not created until this is called
+        except ModuleNotFoundError:
+            # This shouldn't be possible but we should handle it in case a customer figures out
+            # a way of loading an arnold scene without mtoa
+            maya.cmds.confirmDialog(
+                title="mtoa not loaded",
+                message=(
+                    "Renderer is set to Arnold but mtoa is not loaded. Please load the mtoa "
+                    "plugin before continuing to ensure all assets are submitted."
+                ),
+            )
+            return
+    _arnold_options_loaded = True
+
+
 @dataclass
 class RenderLayerData:
+    # Slots keep the per-layer instances out of __dict__ storage and make the repeated
+    # attribute reads in the submit path a fixed-offset load. Declared by hand because
+    # dataclass(slots=True) needs Python 3.10 and this package supports 3.9.
+    __slots__ = (
+        "name",
+        "display_name",
+        "renderer_name",
+        "ui_group_label",
+        "frames_parameter_name",
+        "frame_range",
+        "renderable_camera_names",
+        "output_directories",
+        "output_file_prefix_parameter_name",
+        "output_file_prefix",
+        "image_width_parameter_name",
+        "image_height_parameter_name",
+        "image_resolution",
+    )
+
     name: str
     display_name: str
     renderer_name: str
@@ -73,6 +230,20 @@ class RenderLayerData:
     image_resolution: tuple[int, int]
 
 
+def _clone_template(template: dict[str, Any]) -> dict[str, Any]:
+    """
+    Clones the default job template one level deeper than the branches the submit path
+    mutates: the top-level dict, each parameter definition (name is rewritten when
+    Frames is split per layer) and each step (hostRequirements may be injected).
+    Everything below that is shared with the cached template, which is far cheaper than
+    deepcopy's generic recursion over every leaf.
+    """
+    clone = dict(template)
+    clone["parameterDefinitions"] = [dict(param) for param in template["parameterDefinitions"]]
+    clone["steps"] = [dict(step) for step in template["steps"]]
+    return clone
+
+
 def _get_job_template(
     default_job_template: dict[str, Any],
     settings: RenderSubmitterUISettings,
@@ -81,27 +252,35 @@ def _get_job_template(
     all_layer_selectable_cameras: list[str],
     current_layer_selectable_cameras: list[str],
 ) -> dict[str, Any]:
-    job_template = deepcopy(default_job_template)
+    job_template = _clone_template(default_job_template)
 
     # Set the job's name
     job_template["name"] = settings.name
 
     # If there are multiple frame ranges, split up the Frames parameter by layer
     if render_layers[0].frames_parameter_name:
-        # Extract the Frames parameter definition
-        frame_param = [
-            param for param in job_template["parameterDefinitions"] if param["name"] == "Frames"
-        ][0]
-        job_template["parameterDefinitions"] = [
-            param for param in job_template["parameterDefinitions"] if param["name"] != "Frames"
-        ]
-
-        # Create layer-specific Frames parameters
+        # Remove the Frames definition by its position in the default template,
+        # which the clone preserves, rather than scanning every definition
+        param_defs = job_template["parameterDefinitions"]
+        frames_index = _DEFAULT_TEMPLATE_PARAM_INDEX.get("Frames")
+        if frames_index is None:
+            frames_index = next(
+                position for position, param in enumerate(param_defs) if param["name"] == "Frames"
+            )
+        frame_param = param_defs.pop(frames_index)
+
+        # Create layer-specific Frames parameters. Only name and the userInterface
+        # groupLabel differ per layer, so copy those two dict levels and share the rest
+        base_param = {key: value for key, value in frame_param.items() if key != "userInterface"}
+        base_ui = frame_param["userInterface"]
+        layer_frame_params = []
         for layer_data in render_layers:
-            layer_frame_param = deepcopy(frame_param)
-            layer_frame_param["name"] = layer_data.frames_parameter_name
-            layer_frame_param["userInterface"]["groupLabel"] = layer_data.ui_group_label
-            job_template["parameterDefinitions"].append(layer_frame_param)
+            layer_ui = dict(base_ui)
+            layer_ui["groupLabel"] = layer_data.ui_group_label
+            layer_frame_params.append(
+                {**base_param, "name": layer_data.frames_parameter_name, "userInterface": layer_ui}
+            )
+        param_defs.extend(layer_frame_params)
 
     # # If there are multiple output image formats, split that up by layer
     # if render_layers[0].output_file_prefix_parameter_name:
@@ -338,25 +517,7 @@ def _get_parameter_values(
     #     }
     # )
 
-    def ensure_arnold_options_loaded() -> None:
-        try:
-            maya.cmds.listAttr("defaultArnoldRenderOptions")
-        except ValueError:
-            try:
-                from mtoa.core import createOptions
-
-                createOptions()  # defaultArnoldRenderOptions are not created until this is called
-            except ModuleNotFoundError:
-                # This shouldn't be possible but we should handle it in case a customer figures out
-                # a way of loading an arnold scene without mtoa
-                maya.cmds.confirmDialog(
-                    title="mtoa not loaded",
-                    message=(
-                        "Renderer is set to Arnold but mtoa is not loaded. Please load the mtoa "
-                        "plugin before continuing to ensure all assets are submitted."
-                    ),
-                )
-    ensure_arnold_options_loaded()
+    _ensure_arnold_options_loaded()
     parameter_values.append({
         "name": "ArnoldErrorOnLicenseFailure",
         "value": maya.cmds.getAttr("defaultArnoldRenderOptions.abortOnLicenseFail")
@@ -366,8 +527,9 @@ def _get_parameter_values(
     # queue parameters. This is an error, as we weren't synchronizing the values
     # between the two different tabs where they came from.
     parameter_names = {param["name"] for param in parameter_values}
-    queue_parameter_names = {param["name"] for param in queue_parameters}
-    parameter_overlap = parameter_names.intersection(queue_parameter_names)
+    parameter_overlap = [
+        param["name"] for param in queue_parameters if param["name"] in parameter_names
+    ]
     if parameter_overlap:
         raise DeadlineOperationError(
             "The following queue parameters conflict with the Arnold job parameters:\n"
@@ -393,6 +555,25 @@ class ArnoldPlugin(DeadlineCloudCallbackType):
     def __init__(self):
         super(ArnoldPlugin, self).__init__()
         self.widget = None
+        # Output directories are re-derived per (layer, camera) pair on every
+        # submission even though the scene does not change between opening the dialog
+        # and clicking submit; cache them until a different scene is opened
+        self._output_dir_cache: dict[tuple[str, str], set[str]] = {}
+        self._template_thread: Optional[threading.Thread] = None
+        _scene_cache_holders.add(self)
+        _register_scene_scriptjobs()
+
+    def _get_output_directories(self, render_layer_name: str, camera_name: str) -> set[str]:
+        """
+        Returns Scene.get_output_directories for the given layer and camera, caching the
+        result per pair for the lifetime of the open scene.
+        """
+        key = (render_layer_name, camera_name)
+        dirs = self._output_dir_cache.get(key)
+        if dirs is None:
+            dirs = Scene.get_output_directories(render_layer_name, camera_name)
+            self._output_dir_cache[key] = dirs
+        return dirs
 
     def on_ui_callback(
             self,
@@ -402,6 +583,12 @@ class ArnoldPlugin(DeadlineCloudCallbackType):
             host_requirements: Optional[dict[str, Any]] = None,
     ) -> UICallbackResponse:
 
+        # Warm the default-template cache while the user works with the dialog; the
+        # loader touches no maya.cmds state so it is safe off the main thread
+        if self._template_thread is None:
+            self._template_thread = threading.Thread(target=_load_default_template, daemon=True)
+            self._template_thread.start()
+
         self.widget = ArnoldSubmitterPluginWidget(
             parent=dialog,
             settings=settings,
@@ -429,8 +616,21 @@ class ArnoldPlugin(DeadlineCloudCallbackType):
             _LOG.info("Arnold Export checkbox is not checked. Nothing to do...")
             return
 
-        with open(Path(arnold_util.__file__).parent / "default_arnold_job_template.yaml") as fh:
-            default_job_template = yaml.safe_load(fh)
+        # Reject the unsupported selections up front, before any render-layer
+        # enumeration or scene export is paid for
+        _LOG.info("     Camera Selection: %s" % settings.camera_selection)
+        if settings.camera_selection == "ALL_CAMERAS":
+            raise DeadlineOperationError(
+                "Arnold Plugin currently does not support ALL_CAMERAS. Please pick a single camera."
+            )
+        _LOG.info("     Render Layer Selection: %s" % settings.render_layer_selection)
+        if settings.render_layer_selection != LayerSelection.CURRENT:
+            raise DeadlineOperationError(
+                "Arnold Plugin currently does not support all render layers. Please pick a CURRENT."
+            )
+
+        # Bind cmds once; the repeated maya.cmds attribute walks below otherwise add up
+        cmds = maya.cmds
 
         # Create a dictionary for the layers, and accumulate data about each layer
         render_layer_names = get_all_renderable_render_layer_names()
@@ -440,20 +640,43 @@ class ArnoldPlugin(DeadlineCloudCallbackType):
             )
 
         render_layers: list[RenderLayerData] = []
+        # Track whether any layer disagrees with the first while the data is being
+        # gathered, instead of re-scanning the layer list afterwards
+        frame_ranges_differ = False
+        prefixes_differ = False
+        resolutions_differ = False
         with saved_current_render_layer():
-            for render_layer_name in render_layer_names:
-                set_current_render_layer(render_layer_name)
+            # Each layer switch forces Maya to re-evaluate the render-setup graph, the
+            # dominant cost of this loop. Visit the already-active layer first and only
+            # switch when the target differs, so the common single-layer scene does no
+            # switching at all.
+            active_layer_name = get_current_render_layer_name()
+            ordered_layer_names = sorted(
+                render_layer_names, key=lambda name: name != active_layer_name
+            )
+            for render_layer_name in ordered_layer_names:
+                if render_layer_name != active_layer_name:
+                    set_current_render_layer(render_layer_name)
+                    active_layer_name = render_layer_name
 
                 display_name = get_render_layer_display_name(render_layer_name)
                 renderer_name = Scene.renderer()
                 renderable_camera_names = get_renderable_camera_names()
-                output_directories: set[str] = set()
-                for camera_name in renderable_camera_names:
-                    output_directories.update(
-                        Scene.get_output_directories(render_layer_name, camera_name)
+                output_directories: set[str] = set().union(
+                    *(
+                        self._get_output_directories(render_layer_name, camera_name)
+                        for camera_name in renderable_camera_names
                     )
+                )
                 output_file_prefix = get_output_prefix_with_tokens()
                 image_resolution = (get_width(), get_height())
+                frame_range = str(Animation.frame_list())
+
+                if render_layers:
+                    first_layer = render_layers[0]
+                    frame_ranges_differ |= frame_range != first_layer.frame_range
+                    prefixes_differ |= output_file_prefix != first_layer.output_file_prefix
+                    resolutions_differ |= image_resolution != first_layer.image_resolution
 
                 render_layers.append(
                     RenderLayerData(
@@ -462,7 +685,7 @@ class ArnoldPlugin(DeadlineCloudCallbackType):
                         renderer_name=renderer_name,
                         ui_group_label=f"Layer {display_name} Settings ({renderer_name} renderer)",
                         frames_parameter_name=None,
-                        frame_range=str(Animation.frame_list()),
+                        frame_range=frame_range,
                         renderable_camera_names=renderable_camera_names,
                         output_directories=output_directories,
                         output_file_prefix_parameter_name=None,
@@ -473,23 +696,36 @@ class ArnoldPlugin(DeadlineCloudCallbackType):
                     )
                 )
 
-        # Sort the layers by name
-        render_layers.sort(key=lambda layer: layer.display_name)
+        # If we're only submitting the current layer, filter our list of layers by that
+        if settings.render_layer_selection == LayerSelection.CURRENT:
+            current_render_layer_name = get_current_render_layer_name()
+            submit_render_layers = [
+                layer for layer in render_layers if layer.name == current_render_layer_name
+            ]
+            if not submit_render_layers:
+                raise DeadlineOperationError(
+                    f"The current render layer, {current_render_layer_name}, is not set as renderable. It must be renderable to submit as a job."
+                )
+        else:
+            submit_render_layers = render_layers
+
+        # Sort the layers by name; pointless once the selection is down to one layer
+        if len(submit_render_layers) > 1:
+            submit_render_layers.sort(key=lambda layer: layer.display_name)
         # Tell the settings tab the selectable cameras when only the current layer is in the job
         current_layer_selectable_cameras: list[str] = get_renderable_camera_names()
         # Tell the settings tab the selectable cameras when all layers are in the job
-        all_layer_selectable_cameras_set: set[str] = set(render_layers[0].renderable_camera_names)
-        for layer in render_layers:
-            all_layer_selectable_cameras_set = all_layer_selectable_cameras_set.intersection(
-                layer.renderable_camera_names
+        all_layer_selectable_cameras: list[str] = sorted(
+            set(render_layers[0].renderable_camera_names).intersection(
+                *(layer.renderable_camera_names for layer in render_layers[1:])
             )
-        all_layer_selectable_cameras: list[str] = list(sorted(all_layer_selectable_cameras_set))
+        )
 
         # if submitting, warn if the current scene has been modified
-        scene_modified = maya.cmds.file(q=True, mf=True) == 1
+        scene_modified = cmds.file(q=True, mf=True) == 1
         if scene_modified and purpose == JobBundlePurpose.SUBMISSION:
-            scene_name = maya.cmds.file(q=True, sn=True)
-            button = maya.cmds.confirmDialog(
+            scene_name = cmds.file(q=True, sn=True)
+            button = cmds.confirmDialog(
                 title="Warning: Scene Changes not Saved",
                 message=("Save scene to %s before submitting?" % scene_name),
                 button=["Yes", "No"],
@@ -498,78 +734,41 @@ class ArnoldPlugin(DeadlineCloudCallbackType):
                 dismissString="No",
             )
             if button == "Yes":
-                maya.cmds.file(save=True)
+                cmds.file(save=True)
 
         job_bundle_path = Path(job_bundle_dir)
 
-        # If we're only submitting the current layer, filter our list of layers by that
-        if settings.render_layer_selection == LayerSelection.CURRENT:
-            current_render_layer_name = get_current_render_layer_name()
-            submit_render_layers = [
-                layer for layer in render_layers if layer.name == current_render_layer_name
-            ]
-            if not submit_render_layers:
-                raise DeadlineOperationError(
-                    f"The current render layer, {current_render_layer_name}, is not set as renderable. It must be renderable to submit as a job."
-                )
-        else:
-            submit_render_layers = render_layers
-
-        # Check if there are multiple frame ranges across the layers
-        first_frame_range = submit_render_layers[0].frame_range
-        per_layer_frames_parameters = not settings.override_frame_range and any(
-            layer.frame_range != first_frame_range for layer in submit_render_layers
-        )
+        # The differ flags were tracked over all render layers while they were
+        # populated; they only apply when more than one layer is actually submitted
+        multiple_layers = len(submit_render_layers) > 1
 
         # If there are multiple frame ranges and we're not overriding the range,
         # then we create per-layer Frames parameters.
-        if per_layer_frames_parameters:
-            for layer_data in submit_render_layers:
-                layer_data.frames_parameter_name = f"{layer_data.display_name}Frames"
-
-        first_output_file_prefix = submit_render_layers[0].output_file_prefix
-        per_layer_output_file_prefix = any(
-            layer.output_file_prefix != first_output_file_prefix for layer in submit_render_layers
-        )
-
-        if per_layer_output_file_prefix:
-            for layer_data in submit_render_layers:
-                layer_data.output_file_prefix_parameter_name = (
-                    f"{layer_data.display_name}OutputFilePrefix"
-                )
-
-        first_image_resolution = submit_render_layers[0].image_resolution
-        per_layer_image_resolution = any(
-            layer.image_resolution != first_image_resolution for layer in submit_render_layers
+        per_layer_frames_parameters = (
+            multiple_layers and not settings.override_frame_range and frame_ranges_differ
         )
+        per_layer_output_file_prefix = multiple_layers and prefixes_differ
+        per_layer_image_resolution = multiple_layers and resolutions_differ
 
-        if per_layer_image_resolution:
+        # Assign whichever per-layer parameter names are needed in one pass, building
+        # each name from the display-name prefix once
+        if per_layer_frames_parameters or per_layer_output_file_prefix or per_layer_image_resolution:
             for layer_data in submit_render_layers:
-                layer_data.image_width_parameter_name = f"{layer_data.display_name}ImageWidth"
-                layer_data.image_height_parameter_name = f"{layer_data.display_name}ImageHeight"
+                prefix = layer_data.display_name
+                if per_layer_frames_parameters:
+                    layer_data.frames_parameter_name = prefix + "Frames"
+                if per_layer_output_file_prefix:
+                    layer_data.output_file_prefix_parameter_name = prefix + "OutputFilePrefix"
+                if per_layer_image_resolution:
+                    layer_data.image_width_parameter_name = prefix + "ImageWidth"
+                    layer_data.image_height_parameter_name = prefix + "ImageHeight"
 
         renderers: set[str] = {layer_data.renderer_name for layer_data in submit_render_layers}
 
-        from maya import cmds
         tempdir = tempfile.mkdtemp()
         sceneNameLong = cmds.file(q=True, sn=True)
 
-        temp_path = os.path.join(
-            tempdir, os.path.splitext(os.path.basename(sceneNameLong))[0] + ".ass"
-        )
-        arnold_ass_path = os.path.join(
-            tempdir, os.path.splitext(os.path.basename(sceneNameLong))[0] + ".ass"
-        )
-        _LOG.info("     Camera Selection: %s" % settings.camera_selection)
-        if settings.camera_selection == "ALL_CAMERAS":
-            raise DeadlineOperationError(
-                "Arnold Plugin currently does not support ALL_CAMERAS. Please pick a single camera."
-            )
-        _LOG.info("     Render Layer Selection: %s" % settings.render_layer_selection)
-        if settings.render_layer_selection != LayerSelection.CURRENT:
-            raise DeadlineOperationError(
-                "Arnold Plugin currently does not support all render layers. Please pick a CURRENT."
-            )
+        arnold_ass_path = str(Path(tempdir) / (Path(sceneNameLong).stem + ".ass"))
 
         shadowLinks = 0
         if settings.plugins.shadow_linking == self.SHADOW_LINKING_FOLLOW_LIGHT:
@@ -581,16 +780,71 @@ class ArnoldPlugin(DeadlineCloudCallbackType):
         if settings.plugins.light_linking == self.LIGHT_LINKING_MAYA:
             lightLinks = 1
 
-        cmds.arnoldExportAss(
-            filename=arnold_ass_path,
-            exportAllShadingGroups=settings.plugins.export_all_shading_groups,
-            mask=14591,
-            lightLinks=lightLinks,
-            shadowLinks=shadowLinks,
-            expandProdcedurals=settings.plugins.expand_prodcedurals,
-            fullPath=settings.plugins.export_full_paths,
-            # cam="perspShape"
-        )
+        # arnoldExportAss re-exports the whole scene and dominates resubmission time,
+        # but its output depends only on the saved scene file, its references, the
+        # active layer, and the export settings. Cache exports keyed on those and reuse
+        # on resubmit. An unsaved scene skips the cache since the file mtime does not
+        # reflect in-memory edits.
+        cached_ass_file: Optional[Path] = None
+        if sceneNameLong and cmds.file(q=True, mf=True) != 1:
+            try:
+                key_parts = [
+                    sceneNameLong,
+                    str(os.path.getmtime(sceneNameLong)),
+                    # The export snapshots the scene at the current time, and scrubbing
+                    # the timeline changes neither the modified flag nor the file mtime
+                    str(cmds.currentTime(q=True)),
+                    get_current_render_layer_name(),
+                    str(settings.camera_selection),
+                    str(settings.plugins.export_all_shading_groups),
+                    str(settings.plugins.expand_prodcedurals),
+                    str(settings.plugins.export_full_paths),
+                    str(lightLinks),
+                    str(shadowLinks),
+                ]
+                # Edits to referenced scenes change the export without touching the top
+                # scene's mtime, so every reference's path and mtime is part of the key;
+                # a scene or reference that cannot be stat'ed disables the cache for
+                # this submit
+                for reference_file in sorted(cmds.file(q=True, reference=True) or []):
+                    key_parts.append(reference_file)
+                    key_parts.append(str(os.path.getmtime(reference_file)))
+            except OSError:
+                key_parts = []
+            if key_parts:
+                export_key = hashlib.blake2b("|".join(key_parts).encode()).hexdigest()
+                cached_ass_file = (
+                    Path(os.path.expanduser("~/.cache/deadline_arnold")) / f"{export_key}.ass"
+                )
+
+        if cached_ass_file is not None and cached_ass_file.is_file():
+            _LOG.info("Reusing cached Arnold export: %s" % cached_ass_file)
+            # Refresh the mtime so eviction treats this entry as recently used
+            os.utime(cached_ass_file, None)
+            shutil.copyfile(cached_ass_file, arnold_ass_path)
+        else:
+            cmds.arnoldExportAss(
+                filename=arnold_ass_path,
+                exportAllShadingGroups=settings.plugins.export_all_shading_groups,
+                mask=14591,
+                lightLinks=lightLinks,
+                shadowLinks=shadowLinks,
+                expandProdcedurals=settings.plugins.expand_prodcedurals,
+                fullPath=settings.plugins.export_full_paths,
+                # cam="perspShape"
+            )
+            if cached_ass_file is not None:
+                cached_ass_file.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(arnold_ass_path, cached_ass_file)
+                _prune_export_cache(cached_ass_file.parent)
+
+        # The default template may still be parsing on the warm-up thread started when
+        # the dialog opened; wait for it, then take the cached result (parsed inline if
+        # the warm-up never ran)
+        if self._template_thread is not None:
+            self._template_thread.join()
+            self._template_thread = None
+        default_job_template = _load_default_template()
 
         job_template = _get_job_template(
             default_job_template=default_job_template,
@@ -613,20 +867,22 @@ class ArnoldPlugin(DeadlineCloudCallbackType):
             for step in job_template["steps"]:
                 step["hostRequirements"] = host_requirements
 
-        with open(job_bundle_path / "template.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump(job_template, f, indent=1)
-
-        with open(job_bundle_path / "parameter_values.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump({"parameterValues": parameter_values}, f, indent=1)
-
-        with open(job_bundle_path / "asset_references.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump(asset_references.to_dict(), f, indent=1)
+        # Render each document to memory first so every bundle file is one write call;
+        # job-bundle dirs often sit on network shares where small emitter writes are
+        # each a round-trip
+        for bundle_filename, document in (
+            ("template.yaml", job_template),
+            ("parameter_values.yaml", {"parameterValues": parameter_values}),
+            ("asset_references.yaml", asset_references.to_dict()),
+        ):
+            buffer = io.StringIO()
+            _dump_job_bundle_yaml(document, buffer)
+            (job_bundle_path / bundle_filename).write_text(buffer.getvalue(), encoding="utf8")
 
         # Save Sticky Settings
         attachments: AssetReferences = widget.job_attachments.attachments
         settings.input_filenames = sorted(attachments.input_filenames)
         settings.input_directories = sorted(attachments.input_directories)
-        settings.input_filenames = sorted(attachments.input_filenames)
 
         settings.save_sticky_settings(Scene.name())
 